@@ -9,4 +9,4 @@ def np_transpose(matrix):
     Needs a matrix as input
     Returns a trasposed matrix
     """
-    return matrix.transpose()
+    return matrix.T
@@ -6,7 +6,7 @@ np.random.seed(5)
 
 x = np.random.randn(2000) * 10
 y = np.random.randn(2000) * 10
-z = np.random.rand(2000) + 40 - np.sqrt(np.square(x) + np.square(y))
+z = np.random.rand(2000) + 40 - np.hypot(x, y)
 
 plt.scatter(x, y, c=z)
 plt.xlabel('x coordinate (m)')
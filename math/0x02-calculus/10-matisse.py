@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 """ Derivation """
+import numpy as np
 
 
 def poly_derivative(poly):
@@ -13,6 +14,17 @@ def poly_derivative(poly):
     if type(poly[0]) is not int and type(poly[0]) is not float:
         return None
 
-    derivative = [poly[i] * i for i in range(len(poly))]
-    derivative = derivative[1:] if len(poly) > 1 else [0]
-    return derivative
+    n = len(poly)
+    if n == 1:
+        return [0]
+
+    coeffs = poly[1:]
+    powers = np.arange(1, n)
+    if all(type(c) is float for c in coeffs):
+        return (np.asarray(coeffs, dtype=np.float64) * powers).tolist()
+    if (all(type(c) is int for c in coeffs) and
+            max(abs(c) for c in coeffs) * (n - 1) <= np.iinfo(np.int64).max):
+        return (np.asarray(coeffs, dtype=np.int64) * powers).tolist()
+
+    # mixed types, or products beyond int64: python keeps them exact
+    return [c * i for i, c in enumerate(coeffs, 1)]
@@ -1,24 +1,31 @@
 #!/usr/bin/env python3
 """Function to calculate the integral"""
+import numpy as np
 
 
 def poly_integral(poly, C=0):
     """Function calculating the integral"""
-    new_L = []
-    i = 0
-
     if type(poly) != list or len(poly) == 0 or type(C) != int:
         return None
-    new_L.append(C)
-    if sum(poly) == 0:
-        return new_L
-    if len(poly) == 1:
-        new_L.append(poly[0])
-        return new_L
-    while i < len(poly):
-        if poly[i] % (i + 1) == 0:
-            new_L.append(int(poly[i]/(i + 1)))
-        else:
-            new_L.append(poly[i]/(i + 1))
-        i += 1
-    return new_L
+
+    arr = np.trim_zeros(np.asarray(poly), 'b')
+    if arr.size == 0:
+        return [C]
+
+    powers = np.arange(1, arr.size + 1)
+    if arr.dtype.kind == 'O':
+        # ints beyond int64 stay python ints so they are kept exact
+        return [C] + [c // k if c % k == 0 else c / k
+                      for c, k in zip(arr.tolist(), powers.tolist())]
+
+    coeffs = arr / powers
+    if arr.dtype.kind in 'iu':
+        # exact integer quotients where the power divides the coefficient
+        mask = arr % powers == 0
+        quotients = arr // powers
+    else:
+        mask = np.mod(coeffs, 1) == 0
+        quotients = coeffs
+
+    return [C] + [int(q) if is_int else float(v)
+                  for q, v, is_int in zip(quotients, coeffs, mask)]
@@ -1,6 +1,44 @@
 #!/usr/bin/env python3
 """Valid Convolution"""
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+try:
+    from scipy.signal import fftconvolve
+except ImportError:
+    fftconvolve = None
+
+# kernels with more taps than these go through the FFT instead of the
+# einsum or the compiled loop, which keeps up with it for longer
+EINSUM_MAX_TAPS = 49
+NUMBA_MAX_TAPS = 144
+
+
+if njit is not None:
+    try:
+        # eager signature: compiled at import (and cached on disk) instead of
+        # on the first call
+        @njit('void(float64[:, :, ::1], float64[:, ::1], float64[:, :, ::1])',
+              cache=True, parallel=True, fastmath=True)
+        def _conv_valid_nb(images, kernel, out):
+            """compiled valid convolution, writes the result into out"""
+            m, oh, ow = out.shape
+            kh, kw = kernel.shape
+            for n in prange(m):
+                for i in range(oh):
+                    for j in range(ow):
+                        s = 0.0
+                        for a in range(kh):
+                            for b in range(kw):
+                                s += images[n, i + a, j + b] * kernel[a, b]
+                        out[n, i, j] = s
+    except Exception:
+        # compiling, or loading a stale on-disk cache, can fail at import;
+        # fall back to the numpy paths rather than failing the import
+        njit = None
 
 
 def convolve_grayscale_valid(images, kernel):
@@ -24,19 +62,27 @@ def convolve_grayscale_valid(images, kernel):
     w = images.shape[2]
     kh = kernel.shape[0]
     kw = kernel.shape[1]
-    image_num = np.arange(m)
-    output = np.zeros(shape=(m,
-                             h - kh + 1,
-                             w - kw + 1))
-
-    for i in range(h - kh + 1):
-        for j in range(w - kw + 1):
-            output[image_num, i, j] = np.sum(
-                images[
-                    image_num,
-                    i: i + kh,
-                    j: j + kw
-                ] * kernel,
-                axis=(1, 2)
-            )
-    return output
+
+    use_numba = (njit is not None and images.ndim == 3 and
+                 np.issubdtype(images.dtype, np.floating))
+    max_taps = NUMBA_MAX_TAPS if use_numba else EINSUM_MAX_TAPS
+
+    if fftconvolve is not None and kh * kw > max_taps:
+        # fftconvolve flips the kernel, flip it back to correlate;
+        # one call transforms the whole batch along axes 1 and 2
+        output = fftconvolve(images, kernel[np.newaxis, ::-1, ::-1],
+                             mode='valid', axes=(1, 2))
+        return output.astype(np.float64, copy=False)
+
+    if use_numba:
+        output = np.empty(shape=(m, h - kh + 1, w - kw + 1))
+        _conv_valid_nb(np.ascontiguousarray(images, dtype=np.float64),
+                       np.ascontiguousarray(kernel, dtype=np.float64),
+                       output)
+        return output
+
+    # (m, h - kh + 1, w - kw + 1, kh, kw) view of every kernel window
+    windows = sliding_window_view(images, (kh, kw), axis=(1, 2))
+    output = np.einsum('mijkl,kl->mij', windows, kernel, optimize=True)
+
+    return output.astype(np.float64, copy=False)
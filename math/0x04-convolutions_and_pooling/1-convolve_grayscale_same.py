@@ -24,7 +24,6 @@ def convolve_grayscale_same(images, kernel):
     w = images.shape[2]
     kh = kernel.shape[0]
     kw = kernel.shape[1]
-    image_num = np.arange(m)
     output = np.zeros(shape=(m, h, w))
 
     # pad images before convolution
@@ -38,16 +37,9 @@ def convolve_grayscale_same(images, kernel):
 
     for i in range(h):
         for j in range(w):
-            output[
-                image_num,
-                i,
-                j
-            ] = np.sum(
-                padded_images[
-                    image_num,
-                    i: i + kh,
-                    j: j + kw
-                ] * kernel,
-                axis=(1, 2)
+            output[:, i, j] = np.einsum(
+                'mab,ab->m',
+                padded_images[:, i: i + kh, j: j + kw],
+                kernel
             )
     return output
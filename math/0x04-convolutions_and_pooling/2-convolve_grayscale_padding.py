@@ -26,7 +26,6 @@ def convolve_grayscale_padding(images, kernel, padding):
     w = images.shape[2]
     kh = kernel.shape[0]
     kw = kernel.shape[1]
-    image_num = np.arange(m)
     ph = padding[0]
     pw = padding[1]
 
@@ -40,16 +39,9 @@ def convolve_grayscale_padding(images, kernel, padding):
 
     for i in range(h - kh + 1 + 2 * ph):
         for j in range(w - kw + 1 + 2 * pw):
-            output[
-                image_num,
-                i,
-                j
-            ] = np.sum(
-                padded_images[
-                    image_num,
-                    i: i + kh,
-                    j: j + kw
-                ] * kernel,
-                axis=(1, 2)
+            output[:, i, j] = np.einsum(
+                'mab,ab->m',
+                padded_images[:, i: i + kh, j: j + kw],
+                kernel
             )
     return output
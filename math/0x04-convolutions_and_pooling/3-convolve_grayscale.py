@@ -29,7 +29,6 @@ def convolve_grayscale(images, kernel, padding='same', stride=(1, 1)):
     w = images.shape[2]
     kh = kernel.shape[0]
     kw = kernel.shape[1]
-    image_num = np.arange(m)
     sh = stride[0]
     sw = stride[1]
 
@@ -56,16 +55,9 @@ def convolve_grayscale(images, kernel, padding='same', stride=(1, 1)):
 
     for i in range(int((h - kh + 2 * ph) / sh + 1)):
         for j in range(int((w - kw + 2 * pw) / sw + 1)):
-            output[
-                image_num,
-                i,
-                j
-            ] = np.sum(
-                images[
-                    image_num,
-                    i * sh: i * sh + kh,
-                    j * sw: j * sw + kw
-                ] * kernel,
-                axis=(1, 2)
+            output[:, i, j] = np.einsum(
+                'mab,ab->m',
+                images[:, i * sh: i * sh + kh, j * sw: j * sw + kw],
+                kernel
             )
     return output
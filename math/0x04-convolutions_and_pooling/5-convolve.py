@@ -33,7 +33,6 @@ def convolve(images, kernels, padding='same', stride=(1, 1)):
     kh = kernels.shape[0]
     kw = kernels.shape[1]
     nc = kernels.shape[3]
-    image_num = np.arange(m)
     sh = stride[0]
     sw = stride[1]
 
@@ -59,20 +58,16 @@ def convolve(images, kernels, padding='same', stride=(1, 1)):
                              int((w - kw + 2 * pw) / sw + 1),
                              nc))
 
-    for k in range(nc):
-        for i in range(int((h - kh + 2 * ph) / sh + 1)):
-            for j in range(int((w - kw + 2 * pw) / sw + 1)):
-                output[
-                    image_num,
-                    i,
-                    j,
-                    k
-                ] = np.sum(
-                    images[
-                        image_num,
-                        i * sh: i * sh + kh,
-                        j * sw: j * sw + kw
-                    ] * kernels[:, :, :, k],
-                    axis=(1, 2, 3)
-                )
+    # scratch buffer for the window * kernel product, reused every step
+    scratch = np.empty(shape=(m, kh, kw, c),
+                       dtype=np.result_type(images, kernels))
+
+    # row-major traversal with the kernel loop innermost, so each window
+    # stays in cache while it is multiplied by all nc kernels
+    for i in range(int((h - kh + 2 * ph) / sh + 1)):
+        for j in range(int((w - kw + 2 * pw) / sw + 1)):
+            window = images[:, i * sh: i * sh + kh, j * sw: j * sw + kw]
+            for k in range(nc):
+                np.multiply(window, kernels[:, :, :, k], out=scratch)
+                np.sum(scratch, axis=(1, 2, 3), out=output[:, i, j, k])
     return output
@@ -3,10 +3,33 @@
 import requests
 import time
 import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+# longest rate limit reset, in seconds, worth waiting for before retrying
+MAX_WAIT = 5
 
 if __name__ == '__main__':
-    r = requests.get(sys.argv[1])
-    data = r.json()
+    s = requests.Session()
+    s.headers.update({"Accept": "application/json"})
+    # once retries run out the last response is returned, not raised,
+    # so the status checks below still handle it
+    retries = Retry(total=3, backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False)
+    s.mount('https://', HTTPAdapter(max_retries=retries))
+
+    r = s.get(sys.argv[1], timeout=(3.05, 10))
+    if r.status_code == 403:
+        # rate limited: retry once if the reset is only seconds away
+        wait = int(r.headers["X-Ratelimit-Reset"]) - int(time.time())
+        if wait <= MAX_WAIT:
+            time.sleep(max(0, wait))
+            r = s.get(sys.argv[1], timeout=(3.05, 10))
 
     if r.status_code == 403:
         limit = r.headers["X-Ratelimit-Reset"]
@@ -14,7 +37,7 @@ if __name__ == '__main__':
         print("Reset in {} min".format(int(x)))
 
     elif r.status_code == 200:
-        print(data["location"])
+        print(loads(r.content)["location"])
 
     else:
         print("Not found")
@@ -4,6 +4,7 @@ classification.
 '''
 
 import numpy as np
+from scipy.special import expit
 
 
 class NeuralNetwork:
@@ -85,9 +86,9 @@ class NeuralNetwork:
         '''
 
         x1 = np.matmul(self.__W1, X) + self.__b1
-        self.__A1 = 1 / (1 + np.exp(-x1))
+        self.__A1 = expit(x1)
 
         x2 = np.matmul(self.__W2, self.__A1) + self.__b2
-        self.__A2 = 1 / (1 + np.exp(-x2))
+        self.__A2 = expit(x2)
 
         return self.__A1, self.__A2
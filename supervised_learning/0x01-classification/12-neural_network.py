@@ -4,6 +4,7 @@ classification.
 '''
 
 import numpy as np
+from scipy.special import expit, xlogy
 
 
 class NeuralNetwork:
@@ -85,10 +86,10 @@ class NeuralNetwork:
         '''
 
         x1 = np.matmul(self.__W1, X) + self.__b1
-        self.__A1 = 1 / (1 + np.exp(-x1))
+        self.__A1 = expit(x1)
 
         x2 = np.matmul(self.__W2, self.__A1) + self.__b2
-        self.__A2 = 1 / (1 + np.exp(-x2))
+        self.__A2 = expit(x2)
 
         return self.__A1, self.__A2
 
@@ -103,8 +104,7 @@ class NeuralNetwork:
             the cost of the neural network.
         '''
 
-        loss_sum = np.sum((Y * np.log(A)) + ((1 - Y) * np.log(1.0000001 - A)))
-        return -(1 / A.size) * loss_sum
+        return -(xlogy(Y, A) + xlogy(1 - Y, 1.0000001 - A)).mean()
 
     def evaluate(self, X, Y):
         '''Evaluates the neural network’s predictions
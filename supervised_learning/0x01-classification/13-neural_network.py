@@ -4,6 +4,11 @@ classification.
 '''
 
 import numpy as np
+from scipy.special import expit, xlogy
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
 
 
 class NeuralNetwork:
@@ -85,10 +90,10 @@ class NeuralNetwork:
         '''
 
         x1 = np.matmul(self.__W1, X) + self.__b1
-        self.__A1 = 1 / (1 + np.exp(-x1))
+        self.__A1 = expit(x1)
 
         x2 = np.matmul(self.__W2, self.__A1) + self.__b2
-        self.__A2 = 1 / (1 + np.exp(-x2))
+        self.__A2 = expit(x2)
 
         return self.__A1, self.__A2
 
@@ -103,8 +108,7 @@ class NeuralNetwork:
             the cost of the neural network.
         '''
 
-        loss_sum = np.sum((Y * np.log(A)) + ((1 - Y) * np.log(1.0000001 - A)))
-        return -(1 / A.size) * loss_sum
+        return -(xlogy(Y, A) + xlogy(1 - Y, 1.0000001 - A)).mean()
 
     def evaluate(self, X, Y):
         '''Evaluates the neural network’s predictions
@@ -137,12 +141,18 @@ class NeuralNetwork:
         dw2 = (1 / A1.shape[1]) * np.matmul(dz2, A1.T)
         db2 = (1 / A1.shape[1]) * np.sum(dz2, axis=1, keepdims=True)
 
-        dz1 = np.matmul(self.__W2.T, dz2) * A1 * (1 - A1)
+        m_out = np.matmul(self.__W2.T, dz2)
+        if ne is not None:
+            dz1 = ne.evaluate("m_out * A1 * (1 - A1)")
+        else:
+            m_out *= A1
+            m_out *= 1 - A1
+            dz1 = m_out
         dw1 = (1 / A1.shape[1]) * np.matmul(dz1, X.T)
         db1 = (1 / A1.shape[1]) * np.sum(dz1, axis=1, keepdims=True)
 
-        self.__W1 = self.__W1 - (alpha * dw1)
-        self.__b1 = self.__b1 - (alpha * db1)
+        self.__W1 -= alpha * dw1
+        self.__b1 -= alpha * db1
 
-        self.__W2 = self.__W2 - (alpha * dw2)
-        self.__b2 = self.__b2 - (alpha * db2)
+        self.__W2 -= alpha * dw2
+        self.__b2 -= alpha * db2
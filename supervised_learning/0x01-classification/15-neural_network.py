@@ -4,7 +4,12 @@ classification.
 '''
 
 import numpy as np
+from scipy.special import expit, xlogy
 import matplotlib.pyplot as plt
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
 
 
 class NeuralNetwork:
@@ -86,10 +91,10 @@ class NeuralNetwork:
         '''
 
         x1 = np.matmul(self.__W1, X) + self.__b1
-        self.__A1 = 1 / (1 + np.exp(-x1))
+        self.__A1 = expit(x1)
 
         x2 = np.matmul(self.__W2, self.__A1) + self.__b2
-        self.__A2 = 1 / (1 + np.exp(-x2))
+        self.__A2 = expit(x2)
 
         return self.__A1, self.__A2
 
@@ -104,8 +109,7 @@ class NeuralNetwork:
             the cost of the neural network.
         '''
 
-        loss_sum = np.sum((Y * np.log(A)) + ((1 - Y) * np.log(1.0000001 - A)))
-        return -(1 / A.size) * loss_sum
+        return -(xlogy(Y, A) + xlogy(1 - Y, 1.0000001 - A)).mean()
 
     def evaluate(self, X, Y):
         '''Evaluates the neural network’s predictions
@@ -138,15 +142,21 @@ class NeuralNetwork:
         dw2 = (1 / A1.shape[1]) * np.matmul(dz2, A1.T)
         db2 = (1 / A1.shape[1]) * np.sum(dz2, axis=1, keepdims=True)
 
-        dz1 = np.matmul(self.__W2.T, dz2) * A1 * (1 - A1)
+        m_out = np.matmul(self.__W2.T, dz2)
+        if ne is not None:
+            dz1 = ne.evaluate("m_out * A1 * (1 - A1)")
+        else:
+            m_out *= A1
+            m_out *= 1 - A1
+            dz1 = m_out
         dw1 = (1 / A1.shape[1]) * np.matmul(dz1, X.T)
         db1 = (1 / A1.shape[1]) * np.sum(dz1, axis=1, keepdims=True)
 
-        self.__W1 = self.__W1 - (alpha * dw1)
-        self.__b1 = self.__b1 - (alpha * db1)
+        self.__W1 -= alpha * dw1
+        self.__b1 -= alpha * db1
 
-        self.__W2 = self.__W2 - (alpha * dw2)
-        self.__b2 = self.__b2 - (alpha * db2)
+        self.__W2 -= alpha * dw2
+        self.__b2 -= alpha * db2
 
     def train(self, X, Y, iterations=5000, alpha=0.05, verbose=True,
               graph=True, step=100):
@@ -172,18 +182,20 @@ class NeuralNetwork:
         if alpha <= 0:
             raise ValueError('alpha must be positive')
 
+        log_iters = set()
         if verbose is True or graph is True:
             if not isinstance(step, int):
                 raise TypeError('step must be an integer')
             if step <= 0 or step > iterations:
                 raise ValueError('step must be positive and <= iterations')
+            log_iters = set(range(0, iterations + 1, step)) | {iterations}
             steps_list = []
             steps_cost = []
 
         for i in range(iterations + 1):
             self.forward_prop(X)
             self.gradient_descent(X, Y, self.__A1, self.__A2, alpha)
-            if (i % step == 0 or i == iterations):
+            if i in log_iters:
                 cost = self.cost(Y, self.__A2)
                 steps_list.append(i)
                 steps_cost.append(cost)
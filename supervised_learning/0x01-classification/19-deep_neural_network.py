@@ -4,6 +4,7 @@ Defines a deep neural network performing binary classification
 """
 
 import numpy as np
+from scipy.special import expit, xlogy
 
 
 class DeepNeuralNetwork:
@@ -39,6 +40,9 @@ class DeepNeuralNetwork:
                                        layers[i-1]) * np.sqrt(2/layers[i-1]))
             self.weights[b_key] = np.zeros((layers[i], 1))
 
+        self.__keys = [("W{}".format(i), "b{}".format(i), "A{}".format(i))
+                       for i in range(1, self.__L + 1)]
+
     @property
     def L(self):
         """L getter"""
@@ -62,14 +66,13 @@ class DeepNeuralNetwork:
             The output of the neural network and the cache, respectively
         """
 
-        self.__cache["A0"] = X
-        for i in range(self.__L):
-            cache = self.__cache["A{}".format(i)]
-            b_weights = self.__weights["b{}".format(i+1)]
-            w_weights = self.__weights["W{}".format(i+1)]
-            Z = np.matmul(w_weights, cache) + b_weights
-            self.__cache["A{}".format(i + 1)] = (np.exp(Z) / (np.exp(Z) + 1))
-        return (self.__cache["A{}".format(i + 1)], self.__cache)
+        A = X
+        self.__cache["A0"] = A
+        for W_key, b_key, A_key in self.__keys:
+            Z = np.matmul(self.__weights[W_key], A) + self.__weights[b_key]
+            A = expit(Z)
+            self.__cache[A_key] = A
+        return A, self.__cache
 
     def cost(self, Y, A):
         """Calculates the cost of the model using logistic regression
@@ -81,7 +84,4 @@ class DeepNeuralNetwork:
         Returns:
             The cost
         """
-        m = Y.shape[1]
-        nm = np.multiply
-        cs = -(np.sum(nm(Y, np.log(A)) + nm((1 - Y), np.log(1.0000001 - A))))
-        return cs / m
+        return -(xlogy(Y, A) + xlogy(1 - Y, 1.0000001 - A)).mean()
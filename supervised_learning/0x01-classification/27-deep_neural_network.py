@@ -4,6 +4,7 @@ Defines a deep neural network performing binary classification
 """
 
 import numpy as np
+from scipy.special import expit
 import matplotlib.pyplot as plt
 import pickle
 
@@ -78,7 +79,7 @@ class DeepNeuralNetwork:
                 Ze = np.exp(Z)
                 self.__cache[k_for] = (Ze / np.sum(Ze, axis=0, keepdims=True))
             else:
-                self.__cache[k_for] = 1 / (1 + np.exp(-Z))
+                self.__cache[k_for] = expit(Z)
 
         return self.__cache[k_for], self.__cache
 
@@ -4,6 +4,7 @@ Defines a deep neural network performing binary classification
 """
 
 import numpy as np
+from scipy.special import expit
 import matplotlib.pyplot as plt
 import pickle
 
@@ -11,7 +12,7 @@ import pickle
 class DeepNeuralNetwork:
     """Defines a deep neural network performing binary classification"""
 
-    def __init__(self, nx, layers, activation='sig'):
+    def __init__(self, nx, layers, activation='sig', dtype=np.float64):
         """Class constructor
         Args.
             nx: is the number of input features
@@ -19,6 +20,8 @@ class DeepNeuralNetwork:
             of the network
             activation: represents the type of activation function used in the
             hidden layers
+            dtype: floating point type of the weights and biases, e.g.
+            np.float32 to halve memory traffic during inference
         """
         if not isinstance(nx, int):
             raise TypeError("nx must be an integer")
@@ -28,6 +31,8 @@ class DeepNeuralNetwork:
             raise TypeError("layers must be a list of positive integers")
         if activation not in ["sig", "tanh"]:
             raise ValueError("activation must be 'sig' or 'tanh'")
+        if not np.issubdtype(dtype, np.floating):
+            raise TypeError("dtype must be a floating point type")
         self.nx = nx
         self.layers = layers
         self.__L = len(layers)
@@ -41,7 +46,7 @@ class DeepNeuralNetwork:
             W_key = "W{}".format(i + 1)
             b_key = "b{}".format(i + 1)
 
-            self.weights[b_key] = np.zeros((layers[i], 1))
+            self.weights[b_key] = np.zeros((layers[i], 1), dtype=dtype)
 
             if i == 0:
                 f = np.sqrt(2 / nx)
@@ -50,6 +55,8 @@ class DeepNeuralNetwork:
                 f = np.sqrt(2 / layers[i - 1])
                 h = np.random.randn(layers[i], layers[i - 1]) * f
                 self.__weights[W_key] = h
+            self.__weights[W_key] = self.__weights[W_key].astype(dtype,
+                                                                 copy=False)
 
     @property
     def L(self):
@@ -71,6 +78,12 @@ class DeepNeuralNetwork:
         """Retrieves activation function"""
         return self.__activation
 
+    @property
+    def dtype(self):
+        """Retrieves the floating point type of the parameters"""
+        # read from the weights so unpickled networks don't need it stored
+        return self.__weights['W1'].dtype
+
     def forward_prop(self, X):
         """Calculates the forward propagation of the neural network
         Args.
@@ -90,7 +103,7 @@ class DeepNeuralNetwork:
             Z = Z_matmul + self.__weights[b_key]
             if i != self.__L - 1:
                 if self.__activation == 'sig':
-                    self.__cache[k_for] = 1 / (1 + np.exp(-Z))
+                    self.__cache[k_for] = expit(Z)
                 else:
                     self.__cache[k_for] = np.tanh(Z)
             else:
@@ -122,7 +135,7 @@ class DeepNeuralNetwork:
             The neuron’s prediction and the cost of the network
         """
 
-        self.forward_prop(X)[0]
+        self.forward_prop(X.astype(self.dtype, copy=False))
         A_key = "A" + str(self.__L)
         tmp = np.amax(self.__cache[A_key], axis=0)
         pred = np.where(self.__cache[A_key] == tmp, 1, 0)
@@ -139,6 +152,7 @@ class DeepNeuralNetwork:
         """
 
         m = Y.shape[1]
+        dtype = self.dtype
         weights = self.__weights.copy()
 
         for i in range(self.__L - 1, -1, -1):
@@ -158,8 +172,12 @@ class DeepNeuralNetwork:
             dW = (np.matmul(dZ, cache['A{}'.format(i)].T)) / m
             db = np.sum(dZ, axis=1, keepdims=True) / m
 
-            self.__weights[W_key] = self.__weights[W_key] - alpha * dW
-            self.__weights[b_key] = self.__weights[b_key] - alpha * db
+            # the update math follows the inputs' precision, the stored
+            # parameters keep the network dtype
+            W = self.__weights[W_key] - alpha * dW
+            b = self.__weights[b_key] - alpha * db
+            self.__weights[W_key] = W.astype(dtype, copy=False)
+            self.__weights[b_key] = b.astype(dtype, copy=False)
 
     def train(self,
               X,
@@ -3,6 +3,7 @@
 '''
 
 import numpy as np
+from scipy.special import expit
 
 
 class Neuron:
@@ -53,7 +54,7 @@ class Neuron:
         '''
 
         x = np.matmul(self.__W, X) + self.__b
-        self.__A = 1 / (1 + np.exp(-x))
+        self.__A = expit(x)
         return self.__A
 
     def cost(self, Y, A):
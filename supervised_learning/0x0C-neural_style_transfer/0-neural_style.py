@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 '''Neural Style Transfer Module'''
+import cv2
 import numpy as np
 import tensorflow as tf
 
@@ -73,17 +74,18 @@ class NST():
         h, w, _ = image.shape
         scale = max_dim / max(h, w)
 
-        # batch dimension
-        image = np.expand_dims(image, axis=0)
-
-        # resize image
-        image_t = tf.image.resize_bicubic(
-            images=image,
-            size=[round(h * scale), round(w * scale)],
+        # resize image on the host, no TF op is needed for a one-off
+        # resize (cv2 takes the size as (width, height)); resize in float
+        # since cv2 has no int32/int64/bool kernels and integer inputs
+        # would round the bicubic result
+        image = cv2.resize(
+            image.astype(np.float32),
+            (round(w * scale), round(h * scale)),
+            interpolation=cv2.INTER_CUBIC,
         )
 
         # normalize image:
-        image_t = image_t / 255
-        image_t = tf.clip_by_value(image_t, 0, 1)
+        image = np.clip(image / 255, 0, 1)
 
-        return image_t
+        # batch dimension
+        return tf.constant(np.expand_dims(image, axis=0))
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 '''Neural Style Transfer Module'''
+import cv2
 import numpy as np
 import tensorflow as tf
 
@@ -74,49 +75,48 @@ class NST():
         h, w, _ = image.shape
         scale = max_dim / max(h, w)
 
-        # batch dimension
-        image = np.expand_dims(image, axis=0)
-
-        # resize image
-        image_t = tf.image.resize_bicubic(
-            images=image,
-            size=[int(h * scale), int(w * scale)],
+        # resize image on the host, no TF op is needed for a one-off
+        # resize (cv2 takes the size as (width, height)); resize in float
+        # since cv2 has no int32/int64/bool kernels and integer inputs
+        # would round the bicubic result
+        image = cv2.resize(
+            image.astype(np.float32),
+            (int(w * scale), int(h * scale)),
+            interpolation=cv2.INTER_CUBIC,
         )
 
         # normalize image:
-        image_t = image_t / 255
-        image_t = tf.clip_by_value(image_t, 0, 1)
+        image = np.clip(image / 255, 0, 1)
 
-        return image_t
+        # batch dimension
+        return tf.constant(np.expand_dims(image, axis=0))
 
     def load_model(self):
         '''creates the model used to calculate cost'''
 
-        style_outputs = []
-        content_outputs = []
-
         vgg = tf.keras.applications.VGG19(
             include_top=False,
         )
 
-        for i, layer in enumerate(vgg.layers):
-            if (i == 0):
-                output = vgg.input
-                continue
-            if (type(layer) is tf.keras.layers.MaxPooling2D):
-                layer = tf.keras.layers.AveragePooling2D(
+        def swap_pooling(layer):
+            '''max pooling becomes average pooling, every other layer
+               is reused as is so its pretrained weights are shared'''
+            if (isinstance(layer, tf.keras.layers.MaxPooling2D)):
+                return tf.keras.layers.AveragePooling2D(
                     pool_size=layer.pool_size,
                     strides=layer.strides,
                     padding=layer.padding,
                     name=layer.name,
                 )
-            output = layer(output)
-            layer.trainable = False
-            if (layer.name in self.style_layers):
-                style_outputs.append(output)
-            if (layer.name == self.content_layer):
-                content_outputs.append(output)
+            return layer
+
+        # one functional rebuild of the whole network, no weight copies
+        cloned = tf.keras.models.clone_model(vgg, clone_function=swap_pooling)
+        cloned.trainable = False
 
-        model_outputs = style_outputs + content_outputs
+        # shared layers are also wired into vgg, their last node is the
+        # clone's
+        model_outputs = [cloned.get_layer(name).get_output_at(-1)
+                         for name in self.style_layers + [self.content_layer]]
 
-        self.model = tf.keras.models.Model(vgg.input, model_outputs)
+        self.model = tf.keras.models.Model(cloned.input, model_outputs)
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 '''Neural Style Transfer Module'''
+import cv2
 import numpy as np
 import tensorflow as tf
 
@@ -75,52 +76,51 @@ class NST():
         h, w, _ = image.shape
         scale = max_dim / max(h, w)
 
-        # batch dimension
-        image = np.expand_dims(image, axis=0)
-
-        # resize image
-        image_t = tf.image.resize_bicubic(
-            images=image,
-            size=[int(h * scale), int(w * scale)],
+        # resize image on the host, no TF op is needed for a one-off
+        # resize (cv2 takes the size as (width, height)); resize in float
+        # since cv2 has no int32/int64/bool kernels and integer inputs
+        # would round the bicubic result
+        image = cv2.resize(
+            image.astype(np.float32),
+            (int(w * scale), int(h * scale)),
+            interpolation=cv2.INTER_CUBIC,
         )
 
         # normalize image:
-        image_t = image_t / 255
-        image_t = tf.clip_by_value(image_t, 0, 1)
+        image = np.clip(image / 255, 0, 1)
 
-        return image_t
+        # batch dimension
+        return tf.constant(np.expand_dims(image, axis=0))
 
     def load_model(self):
         '''creates the model used to calculate cost'''
 
-        style_outputs = []
-        content_outputs = []
-
         vgg = tf.keras.applications.VGG19(
             include_top=False,
         )
 
-        for i, layer in enumerate(vgg.layers):
-            if (i == 0):
-                output = vgg.input
-                continue
-            if (type(layer) is tf.keras.layers.MaxPooling2D):
-                layer = tf.keras.layers.AveragePooling2D(
+        def swap_pooling(layer):
+            '''max pooling becomes average pooling, every other layer
+               is reused as is so its pretrained weights are shared'''
+            if (isinstance(layer, tf.keras.layers.MaxPooling2D)):
+                return tf.keras.layers.AveragePooling2D(
                     pool_size=layer.pool_size,
                     strides=layer.strides,
                     padding=layer.padding,
                     name=layer.name,
                 )
-            output = layer(output)
-            layer.trainable = False
-            if (layer.name in self.style_layers):
-                style_outputs.append(output)
-            if (layer.name == self.content_layer):
-                content_outputs.append(output)
+            return layer
+
+        # one functional rebuild of the whole network, no weight copies
+        cloned = tf.keras.models.clone_model(vgg, clone_function=swap_pooling)
+        cloned.trainable = False
 
-        model_outputs = style_outputs + content_outputs
+        # shared layers are also wired into vgg, their last node is the
+        # clone's
+        model_outputs = [cloned.get_layer(name).get_output_at(-1)
+                         for name in self.style_layers + [self.content_layer]]
 
-        self.model = tf.keras.models.Model(vgg.input, model_outputs)
+        self.model = tf.keras.models.Model(cloned.input, model_outputs)
 
     @staticmethod
     def gram_matrix(input_layer):
@@ -135,26 +135,28 @@ class NST():
         a = input_layer
 
         if (not (isinstance(a, tf.Tensor) or isinstance(a, tf.Variable))
-                or tf.rank(a).numpy() != 4):
+                or a.shape.ndims != 4):
             raise TypeError("input_layer must be a tensor of rank 4")
 
         # === way 1 ===
         # gram = tf.tensordot(a, a, [[0, 1, 2], [0, 1, 2]])
 
-        # === way 2 ===
-        # channels = int(a.shape[-1])
-        # a_ = tf.reshape(a, [-1, channels])
-        # gram = tf.matmul(a_, a_, transpose_a=True)
+        # === way 2 - batched matmul ===
+        # flatten the spatial dims but keep the batch one, so the product
+        # lowers to a single GEMM and already has shape (1, c, c)
+        _, h, w, c = a.shape.as_list()
+        a_ = tf.reshape(a, [-1, h * w, c])
+        gram = tf.matmul(a_, a_, transpose_a=True)
 
         # === way 3 - einstein notation ===
         # b: batch, h:height, w:width, c: channels, s: second_channels
-        gram = tf.linalg.einsum("bhwc,bhws->bcs", a, a)
+        # gram = tf.linalg.einsum("bhwc,bhws->bcs", a, a)
 
         # normalize gram matrix
-        hw = tf.cast(a.shape[1] * a.shape[2], tf.float32)
+        hw = tf.cast(h * w, tf.float32)
         gram_normalized = gram / hw
 
-        # for ways 1 & 2 - to recover the batch dimension
+        # for way 1 - to recover the batch dimension
         # gram_normalized = tf.expand_dims(gram_normalized, axis=0)
 
         return gram_normalized
@@ -172,11 +174,27 @@ class NST():
         )
 
         n_style_layers = len(self.style_layers)
-        style_features = self.model(p_style_image)[:n_style_layers]
+        if (self.style_image.shape == self.content_image.shape):
+            # same size images share a single batch of 2 forward pass
+            outputs = self.model(tf.concat([p_style_image,
+                                            p_content_image], axis=0))
+            style_outputs = [output[0:1] for output in outputs]
+            content_outputs = [output[1:2] for output in outputs]
+        else:
+            style_outputs = self.model(p_style_image)
+            content_outputs = self.model(p_content_image)
+
+        style_features = style_outputs[:n_style_layers]
+        # the targets are constants of the cost, keep them off the tape
+        self.content_feature = tf.stop_gradient(
+            content_outputs[n_style_layers:][0]
+        )
 
-        self.content_feature = self.model(p_content_image)[n_style_layers:][0]
-        self.gram_style_features = [self.gram_matrix(style_feature)
-                                    for style_feature in style_features]
+        # layers have different channel counts, so the targets stay a list
+        self.gram_style_features = [
+            tf.stop_gradient(self.gram_matrix(style_feature))
+            for style_feature in style_features
+        ]
 
     def layer_style_cost(self, style_output, gram_target):
         '''Calculates the style cost for a single layer
@@ -189,14 +207,14 @@ class NST():
         '''
         if (not (isinstance(style_output, tf.Tensor) or
                  isinstance(style_output, tf.Variable)) or
-                tf.rank(style_output).numpy() != 4):
+                style_output.shape.ndims != 4):
             raise TypeError("style_output must be a tensor of rank 4")
 
         c = style_output.shape.as_list()[-1]  # channels
 
         if (not (isinstance(gram_target, tf.Tensor) or
                  isinstance(gram_target, tf.Variable)) or
-                tf.rank(gram_target).numpy() != 3 or
+                gram_target.shape.ndims != 3 or
                 gram_target.shape != (1, c, c)):
             raise TypeError("gram_target must be a tensor of "
                             "shape [1, {}, {}]".format(c, c))
@@ -224,14 +242,13 @@ class NST():
                             "length of {}".format(len_style_layers))
 
         weight = 1 / len_style_layers
-        s_cost = 0
-
-        gram_targets = self.gram_style_features
 
-        for s_output, target in zip(style_outputs, self.gram_style_features):
-            s_cost += self.layer_style_cost(s_output, target) * weight
+        # one AddN op instead of a chain of scalar additions
+        costs = [self.layer_style_cost(s_output, target)
+                 for s_output, target in zip(style_outputs,
+                                             self.gram_style_features)]
 
-        return s_cost
+        return tf.add_n(costs) * weight
 
     def content_cost(self, content_output):
         '''Calculates the content cost for the generated image
@@ -370,26 +387,41 @@ class NST():
             beta2=beta2,
         )
 
-        best_loss = tf.cast(0, tf.float32)
+        # trace the gradient step, tape included, into a graph function
+        # once per call; it reads alpha, beta and the feature targets as
+        # they are now, and every iteration reuses the same graph
+        train_step = tf.contrib.eager.defun(self.compute_grads)
+
+        # the best cost and image live on the device; comparing and
+        # copying them inside a graph avoids a host sync every iteration
+        best_loss = tf.contrib.eager.Variable(0, dtype=tf.float32)
+        best_img = tf.contrib.eager.Variable(self.content_image)
+
+        def keep_best(J_total, image):
+            better = tf.logical_or(J_total < best_loss,
+                                   tf.equal(best_loss, 0))
+            return tf.cond(better,
+                           lambda: tf.group(best_loss.assign(J_total),
+                                            best_img.assign(image)),
+                           tf.no_op)
+
+        keep_best = tf.contrib.eager.defun(keep_best)
 
         for i in range(iterations + 1):
             # calculate gradients:
-            grads, J_total, J_content, J_style = self.compute_grads(
-                generated_image
-            )
+            grads, J_total, J_content, J_style = train_step(generated_image)
 
             # keep track of the best cost and the image associated with it
-            if (J_total < best_loss or best_loss.numpy() == 0):
-                best_loss = J_total
-                best_img = generated_image
+            keep_best(J_total, generated_image)
 
             # gradient descent;
             opt.apply_gradients([(grads, generated_image)])
 
-            # step info:
+            # step info, the only place the costs are fetched to the host:
             if (step is not None and (i % step == 0 or i == iterations)):
                 print("Cost at iteration {}: {}, content {}, "
-                      "style {}".format(i, J_total, J_content, J_style))
+                      "style {}".format(i, J_total.numpy(),
+                                        J_content.numpy(), J_style.numpy()))
 
         best_img = np.squeeze(best_img.numpy(), 0)
 
@@ -2,6 +2,7 @@
 """
     Attention
 """
+import math
 import tensorflow as tf
 positional_encoding = __import__('4-positional_encoding').positional_encoding
 DecoderBlock = __import__('8-transformer_decoder_block').DecoderBlock
@@ -24,8 +25,10 @@ class Decoder(tf.keras.layers.Layer):
             N - the number of blocks in the encoder
             dm - the dimensionality of the model
             embedding - the embedding layer for the inputs
-            positional_encoding - a numpy.ndarray of shape (max_seq_len, dm)
-                containing the positional encodings
+            positional_encoding - a float32 tf.Tensor of shape
+                (max_seq_len, dm) containing the positional encodings
+            sqrt_dm - a float32 tf.Tensor holding sqrt(dm), the embedding
+                scale
             blocks - a list of length N containing all of the EncoderBlock‘s
             dropout - the dropout layer, applied to the positional encodings
         """
@@ -34,7 +37,11 @@ class Decoder(tf.keras.layers.Layer):
         self.dm = dm
         self.embedding = tf.keras.layers.Embedding(input_dim=target_vocab,
                                                    output_dim=dm)
-        self.positional_encoding = positional_encoding(max_seq_len, dm)
+        # converted once so each call slices a tensor instead of
+        # converting a numpy slice
+        self.positional_encoding = tf.constant(
+            positional_encoding(max_seq_len, dm), dtype=tf.float32)
+        self.sqrt_dm = tf.constant(math.sqrt(dm), tf.float32)
         self.blocks = [DecoderBlock(dm, h, hidden, drop_rate)
                        for _ in range(N)]
         self.dropout = tf.keras.layers.Dropout(drop_rate)
@@ -53,20 +60,33 @@ class Decoder(tf.keras.layers.Layer):
         """
         seq_len = x.get_shape().as_list()[1]
         # seq_len = x.shape[1]
-        attention_weights = {}
 
         x = self.embedding(x)  # (batch_size, target_seq_len, d_model)
-        x = x * tf.math.sqrt(tf.cast(self.dm, tf.float32))
+        x = x * self.sqrt_dm
         x = x + self.positional_encoding[:seq_len, :]
 
         x = self.dropout(x, training=training)
 
-        for i in range(self.N):
-            x = self.blocks[i](x, encoder_output, training,
+        # x.shape == (batch_size, target_seq_len, d_model)
+        return self.run_blocks(x, encoder_output, training,
                                look_ahead_mask, padding_mask)
 
-            # attention_weights[f'decoder_layer{i+1}_block1'] = block1
-            # attention_weights[f'decoder_layer{i+1}_block2'] = block2
-
-        # x.shape == (batch_size, target_seq_len, d_model)
-        return x  # , attention_weights
+    @tf.function(experimental_relax_shapes=True)
+    def run_blocks(self, x, encoder_output, training, look_ahead_mask,
+                   padding_mask):
+        """
+            Runs x through the N decoder blocks as one traced graph; the
+            loop over blocks is unrolled once at trace time instead of
+            dispatching every block eagerly on each call
+            x - a tensor of shape (batch, target_seq_len, dm)
+            encoder_output - a tensor of shape (batch, input_seq_len, dm)
+            training - a boolean to determine if the model is training
+            look_ahead_mask - mask applied to 1st multi head attention layer
+            padding_mask - mask to be applied to 2nd multi head attention layer
+            Returns: tensor of shape
+                (batch, target_seq_len, dm) containing decoder output
+        """
+        for block in self.blocks:
+            x = block(x, encoder_output, training,
+                      look_ahead_mask, padding_mask)
+        return x
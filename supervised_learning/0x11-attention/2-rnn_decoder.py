@@ -25,6 +25,8 @@ class RNNDecoder(tf.keras.layers.Layer):
                     the last hidden state
                 Recurrent weights should be initialized with glorot_uniform
             F - a Dense layer with vocab units
+            attention - a SelfAttention layer with units units, built once
+                so its weights are shared and trained across calls
         """
         super(RNNDecoder, self).__init__()
         self.embedding = tf.keras.layers.Embedding(input_dim=vocab,
@@ -34,6 +36,7 @@ class RNNDecoder(tf.keras.layers.Layer):
                                        return_state=True,
                                        recurrent_initializer='glorot_uniform')
         self.F = tf.keras.layers.Dense(vocab)
+        self.attention = SelfAttention(units)
 
     def call(self, x, s_prev, hidden_states):
         """
@@ -49,8 +52,7 @@ class RNNDecoder(tf.keras.layers.Layer):
             s is a tensor of shape (batch, units) containing the new
                 decoder hidden state
         """
-        context, attention = SelfAttention(s_prev.get_shape
-                                           ()[1])(s_prev, hidden_states)
+        context, attention = self.attention(s_prev, hidden_states)
         x = self.embedding(x)
         x = tf.concat([tf.expand_dims(context, 1), x], axis=-1)
         y, s = self.gru(x)
@@ -2,9 +2,87 @@
 """Function that calculates the Shannon entropy
 and P affinities relative to a data point"""
 
+import math
 import numpy as np
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 P_init = __import__('2-P_init').P_init
-HP = __import__('3-entropy').HP
+
+# bisection steps per point; a perplexity the data cannot reach (e.g.
+# perplexity >= n - 1) would otherwise never meet the tolerance
+MAX_ITER = 100
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _solve_betas(D, betas, H, tol, max_iter):
+        """
+        compiled per-point bisection, writes the solved betas in place
+        Args:
+            D: numpy.ndarray of shape (n, n), squared pairwise distances
+            betas: numpy.ndarray of shape (n, 1), initial betas
+            H: Shannon entropy of the target perplexity
+            tol: maximum tolerance allowed for the entropy difference
+            max_iter: maximum number of bisection steps per point
+        """
+        n = D.shape[0]
+        for i in prange(n):
+            beta = betas[i, 0]
+            b_min = 0.0
+            b_max = 0.0
+            has_min = False
+            has_max = False
+            for _ in range(max_iter):
+                # entropy in one pass over the row:
+                # H = log(sum(p)) + beta * sum(D * p) / sum(p), in nats
+                s = 0.0
+                sd = 0.0
+                for j in range(n):
+                    if j != i:
+                        p = math.exp(-D[i, j] * beta)
+                        s += p
+                        sd += D[i, j] * p
+                Hdiff = (math.log(s) + beta * sd / s) / math.log(2.) - H
+                if abs(Hdiff) <= tol:
+                    break
+                if Hdiff > 0:
+                    b_min = beta
+                    has_min = True
+                    if has_max:
+                        beta = (beta + b_max) / 2.
+                    else:
+                        beta = beta * 2.
+                else:
+                    b_max = beta
+                    has_max = True
+                    if has_min:
+                        beta = (beta + b_min) / 2.
+                    else:
+                        beta = beta / 2.
+            betas[i, 0] = beta
+
+
+def _row_entropy(D, betas, mask):
+    """
+    Shannon entropies and P affinities of several data points at once;
+    a batched 3-entropy.HP, which sums its entropy over every entry and
+    so only works one point at a time
+    Args:
+        D: numpy.ndarray of shape (k, n), squared distances of k points
+        betas: numpy.ndarray of shape (k, 1), beta of each point
+        mask: numpy.ndarray of shape (k, n), False where a point is
+            compared with itself
+    Returns:
+        Hs of shape (k,) and Ps of shape (k, n), zero on masked entries
+    """
+    Ps = np.exp(-D * betas)
+    Ps[~mask] = 0
+    Ps /= np.sum(Ps, axis=1, keepdims=True)
+    logs = np.log2(Ps, out=np.zeros_like(Ps), where=Ps > 0)
+    Hs = -np.sum(Ps * logs, axis=1)
+    return Hs, Ps
 
 
 def P_affinities(X, tol=1e-5, perplexity=30.0):
@@ -23,31 +101,42 @@ def P_affinities(X, tol=1e-5, perplexity=30.0):
     if n == 0:
         return P
 
-    for i in range(n):
-        row = D[i].copy()
-        row = np.delete(row, i, axis=0)
-        Hi, Pi = HP(row, betas[i])
-        Hdiff = Hi - H
-        b_max = None
-        b_min = None
-        while np.abs(Hdiff) > tol:
-            if Hdiff > 0:
-                b_min = betas[i, 0]
-                if b_max is None:
-                    betas[i, 0] = betas[i, 0] * 2.
-                else:
-                    betas[i, 0] = (betas[i, 0] + b_max) / 2.
-            else:
-                b_max = betas[i, 0]
-                if b_min is None:
-                    betas[i, 0] = betas[i, 0] / 2.
-                else:
-                    betas[i, 0] = (betas[i, 0] + b_min) / 2.
+    mask = ~np.eye(n, dtype=bool)
+
+    if njit is not None:
+        _solve_betas(D, betas, H, tol, MAX_ITER)
+        _, P = _row_entropy(D, betas, mask)
+    else:
+        # the bisection runs for every point at once; rows that have
+        # reached the target entropy drop out of the active set
+        b_min = np.full(n, -np.inf)
+        b_max = np.full(n, np.inf)
+
+        Hs, P = _row_entropy(D, betas, mask)
+        Hdiff = Hs - H
+        active = np.abs(Hdiff) > tol
+        for _ in range(MAX_ITER):
+            if not np.any(active):
+                break
+            beta = betas[:, 0]
+            up = active & (Hdiff > 0)
+            down = active & (Hdiff <= 0)
+            b_min = np.where(up, beta, b_min)
+            b_max = np.where(down, beta, b_max)
+            beta_up = np.where(np.isinf(b_max), beta * 2.,
+                               (beta + b_max) / 2.)
+            beta_down = np.where(np.isinf(b_min), beta / 2.,
+                                 (beta + b_min) / 2.)
+            betas[:, 0] = np.where(up, beta_up,
+                                   np.where(down, beta_down, beta))
 
-            Hi, Pi = HP(row, betas[i])
-            Hdiff = Hi - H
-        Pi = np.insert(Pi, i, 0)
-        P[i] = Pi
+            Hs, P[active] = _row_entropy(D[active], betas[active],
+                                         mask[active])
+            Hdiff[active] = Hs - H
+            active = np.abs(Hdiff) > tol
 
-    P = (P.T + P) / (2 * n)
+    # symmetrize in place; NumPy buffers the overlapping transpose, so
+    # this needs one extra n x n array instead of two
+    P += P.T
+    P /= 2 * n
     return P
@@ -37,6 +37,23 @@ class BayesianOptimization:
         self.X_s = (np.sort(X_s)).reshape(-1, 1)
         self.xsi = xsi
         self.minimize = minimize
+        # best observed output and the number of samples it covers
+        self._best_Y = None
+        self._best_n = 0
+
+    def _best_output(self):
+        """
+        Returns the best observed output, gp.Y is only rescanned when
+        samples were added since the last scan
+        """
+        n = self.gp.Y.shape[0]
+        if n != self._best_n:
+            if self.minimize is True:
+                self._best_Y = np.amin(self.gp.Y)
+            else:
+                self._best_Y = np.amax(self.gp.Y)
+            self._best_n = n
+        return self._best_Y
 
     def acquisition(self):
         """
@@ -49,28 +66,17 @@ class BayesianOptimization:
         """
         mu, sigma = self.gp.predict(self.X_s)
 
+        optimize = self._best_output()
         if self.minimize is True:
-            optimize = np.amin(self.gp.Y)
             imp = optimize - mu - self.xsi
 
         else:
-            optimize = np.amax(self.gp.Y)
             imp = mu - optimize - self.xsi
 
-        Z = np.zeros(sigma.shape[0])
-
-        for i in range(sigma.shape[0]):
-            if sigma[i] != 0:
-                Z[i] = imp[i] / sigma[i]
-            else:
-                Z[i] = 0
-
-        ei = np.zeros(sigma.shape)
-        for i in range(len(sigma)):
-            if sigma[i] > 0:
-                ei[i] = imp[i] * norm.cdf(Z[i]) + sigma[i] * norm.pdf(Z[i])
-            else:
-                ei[i] = 0
+        sigma_safe = np.where(sigma > 0, sigma, 1.0)
+        Z = np.where(sigma > 0, imp / sigma_safe, 0.0)
+        ei = np.where(sigma > 0,
+                      imp * norm.cdf(Z) + sigma * norm.pdf(Z), 0.0)
 
         X_next = self.X_s[np.argmax(ei)]
 
@@ -91,7 +97,16 @@ class BayesianOptimization:
             if [x_new] in self.gp.X:
                 break
             y_new = self.f(x_new)
+            n = self.gp.Y.shape[0]
             self.gp.update(x_new, y_new)
+            # fold the new sample into the best output when it was up
+            # to date, otherwise the next acquisition rescans gp.Y
+            if self._best_n == n:
+                if self.minimize is True:
+                    self._best_Y = min(self._best_Y, np.amin(y_new))
+                else:
+                    self._best_Y = max(self._best_Y, np.amax(y_new))
+                self._best_n = self.gp.Y.shape[0]
 
         if self.minimize is True:
             index = np.argmin(self.gp.Y)